@@ -3,7 +3,11 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import random
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,16 +27,20 @@ from discord import (
 )
 from discord.ext.commands import Cog
 
-from bot.settings import Settings
+from bot.settings import DatabaseBackend, DatabaseSettings, Settings
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
+    from contextlib import AbstractAsyncContextManager
 
     from discord.abc import MessageableChannel, User
+    from redis.asyncio import Redis
+    from redis.asyncio.lock import Lock
 
     from bot.bot import RussianRoulette
 
 settings = Settings.model_validate({})
+log = logging.getLogger(__name__)
 
 
 class GameError(Exception):
@@ -121,12 +129,55 @@ class GameInstance:
             self.current_player = self.players[0]
 
 
-class GameDB:
-    def __init__(self, bot: RussianRoulette, /, *, file_path: Path = Path("data/games.json")) -> None:
+class GameDB(ABC):
+    def __init__(self, bot: RussianRoulette, /) -> None:
         self.bot = bot
+
+    @classmethod
+    def from_settings(cls, bot: RussianRoulette, settings: DatabaseSettings) -> GameDB:
+        if settings.backend == DatabaseBackend.REDIS:
+            return RedisGameDB(
+                bot,
+                url=settings.url,
+                max_connections=settings.max_connections,
+                pool_timeout=settings.pool_timeout,
+                key_prefix=settings.key_prefix,
+                lock_timeout=settings.lock_timeout,
+            )
+        return JSONGameDB(bot, file_path=settings.file_path)
+
+    @abstractmethod
+    async def get(self, id: int) -> GameInstance | None: ...
+
+    @abstractmethod
+    async def put(self, game: GameInstance) -> str: ...
+
+    @abstractmethod
+    async def delete(self, id: int) -> None: ...
+
+    @abstractmethod
+    async def stop(self, id: int) -> None:
+        """Stop the game in a channel, wherever it is running."""
+
+    @abstractmethod
+    def lock(self, game: GameInstance) -> AbstractAsyncContextManager[None]:
+        """Claim the right to run a game, raising `GameError` if its channel is already claimed.
+
+        The game is stopped if the claim is lost while it is running,
+        and its stored state is deleted when the claim is released.
+        """
+
+    async def close(self) -> None:
+        return None
+
+
+class JSONGameDB(GameDB):
+    def __init__(self, bot: RussianRoulette, /, *, file_path: Path = Path("data/games.json")) -> None:
+        super().__init__(bot)
         self._file_path = file_path
+        self._running: dict[int, GameInstance] = {}
 
-    def get(self, id: int) -> GameInstance | None:
+    async def get(self, id: int) -> GameInstance | None:
         with self._file_path.open("r") as file:
             games = dict(json.load(file))
         data = games.get(str(id))
@@ -134,7 +185,7 @@ class GameDB:
             return GameInstance.from_dict(data, self.bot)
         return data
 
-    def put(self, game: GameInstance) -> str:
+    async def put(self, game: GameInstance) -> str:
         with self._file_path.open("r") as file:
             games = dict(json.load(file))
         key = str(game.channel.id)
@@ -143,7 +194,7 @@ class GameDB:
             json.dump(games, file)
         return key
 
-    def delete(self, id: int) -> None:
+    async def delete(self, id: int) -> None:
         with self._file_path.open("r") as file:
             games = dict(json.load(file))
         key = str(id)
@@ -151,6 +202,216 @@ class GameDB:
         with self._file_path.open("w") as file:
             json.dump(games, file)
 
+    async def stop(self, id: int) -> None:
+        game = self._running.get(id)
+        if game is not None:
+            # The stored state is deleted once the game loop releases its lock.
+            game.stop()
+        else:
+            # Left behind by a previous run of the bot.
+            await self.delete(id)
+
+    @asynccontextmanager
+    async def lock(self, game: GameInstance) -> AsyncIterator[None]:
+        id = game.channel.id
+        if id in self._running:
+            msg = "A game is already in progress."
+            raise GameError(msg)
+        self._running[id] = game
+        try:
+            yield
+        finally:
+            del self._running[id]
+            await self.delete(id)
+
+
+# Deletes the game and releases its lock in one step, but only if the lock is still held with the given token.
+RELEASE_GAME_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    redis.call("del", unpack(KEYS))
+    return 1
+end
+return 0
+"""
+
+
+class RedisGameDB(GameDB):
+    """Game state shared between bot processes through a Redis-compatible server.
+
+    Each game is stored as a hash of its scalar fields plus a list of player IDs.
+    Both keys expire unless the process running the game keeps refreshing them.
+    Pass `client` to use an existing connection with `decode_responses=True`,
+    such as an in-process `fakeredis.FakeAsyncRedis` in tests.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        bot: RussianRoulette,
+        /,
+        *,
+        url: str = "redis://localhost:6379/0",
+        max_connections: int = 10,
+        pool_timeout: float = 5,
+        key_prefix: str = "rr:",
+        lock_timeout: float = 60,
+        client: Redis | None = None,
+    ) -> None:
+        super().__init__(bot)
+        if client is None:
+            try:
+                from redis.asyncio import BlockingConnectionPool, Redis  # noqa: PLC0415
+            except ImportError as exc:
+                msg = "the redis backend requires the 'redis' package to be installed"
+                raise RuntimeError(msg) from exc
+            # Wait for a free connection instead of failing when they are all in use.
+            pool = BlockingConnectionPool.from_url(
+                url,
+                max_connections=max_connections,
+                timeout=pool_timeout,
+                decode_responses=True,
+            )
+            client = Redis.from_pool(pool)
+            self._owns_client = True
+        else:
+            self._owns_client = False
+        self._client = client
+        self._key_prefix = key_prefix
+        self._lock_timeout = lock_timeout
+        self._running: dict[int, GameInstance] = {}
+        self._release_game = client.register_script(RELEASE_GAME_SCRIPT)
+
+    @property
+    def _ttl(self) -> int:
+        return int(self._lock_timeout * 1000)
+
+    def _game_key(self, id: int) -> str:
+        return f"{self._key_prefix}game:{id}"
+
+    def _players_key(self, id: int) -> str:
+        return f"{self._key_prefix}game:{id}:players"
+
+    def _lock_key(self, id: int) -> str:
+        return f"{self._key_prefix}lock:{id}"
+
+    def _stop_key(self, id: int) -> str:
+        return f"{self._key_prefix}stop:{id}"
+
+    async def get(self, id: int) -> GameInstance | None:
+        # Fetch both keys in a single round trip.
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self._game_key(id))
+            pipe.lrange(self._players_key(id), 0, -1)
+            fields, players = await pipe.execute()
+        if not fields:
+            return None
+        data = {
+            "channel": int(fields["channel"]),
+            "creator": int(fields["creator"]),
+            "players": [int(player) for player in players],
+            "current_player": int(fields["current_player"]),
+            "started": fields["started"] == "1",
+            "stopped": fields["stopped"] == "1",
+        }
+        return GameInstance.from_dict(data, self.bot)
+
+    async def put(self, game: GameInstance) -> str:
+        data = game.to_dict()
+        id = data["channel"]
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                self._game_key(id),
+                mapping={
+                    "channel": id,
+                    "creator": data["creator"],
+                    "current_player": data["current_player"],
+                    "started": int(data["started"]),
+                    "stopped": int(data["stopped"]),
+                },
+            )
+            pipe.pexpire(self._game_key(id), self._ttl)
+            pipe.delete(self._players_key(id))
+            if data["players"]:
+                pipe.rpush(self._players_key(id), *data["players"])
+                pipe.pexpire(self._players_key(id), self._ttl)
+            await pipe.execute()
+        return str(id)
+
+    async def delete(self, id: int) -> None:
+        await self._client.delete(self._game_key(id), self._players_key(id), self._stop_key(id))
+
+    async def stop(self, id: int) -> None:
+        game = self._running.get(id)
+        if game is not None:
+            # The stored state is deleted once the game loop releases its lock.
+            game.stop()
+        elif await self._client.exists(self._lock_key(id)):
+            # Another process owns the game and picks this up on its next refresh.
+            await self._client.set(self._stop_key(id), 1, px=self._ttl)
+        else:
+            # Left behind by a process that exited mid-game.
+            await self.delete(id)
+
+    @asynccontextmanager
+    async def lock(self, game: GameInstance) -> AsyncIterator[None]:
+        from redis.exceptions import RedisError  # noqa: PLC0415
+
+        id = game.channel.id
+        token = uuid.uuid4().hex
+        lock = self._client.lock(self._lock_key(id), timeout=self._lock_timeout, thread_local=False)
+        if not await lock.acquire(blocking=False, token=token):
+            msg = "A game is already in progress."
+            raise GameError(msg)
+        # Clear a stop request aimed at a previous game in this channel.
+        await self._client.delete(self._stop_key(id))
+        self._running[id] = game
+        # The lock and game keys expire if this process dies, so a new game can be started.
+        keep_alive = asyncio.create_task(self._keep_alive(lock, game))
+        try:
+            yield
+        finally:
+            del self._running[id]
+            keep_alive.cancel()
+            with suppress(asyncio.CancelledError):
+                try:
+                    await keep_alive
+                except Exception:
+                    log.exception("Keep-alive for the game in channel %s failed", id)
+            # Leave the state alone if another process has taken over the channel.
+            keys = [self._lock_key(id), self._game_key(id), self._players_key(id), self._stop_key(id)]
+            try:
+                await self._release_game(keys=keys, args=[token])
+            except RedisError:
+                # The lock and game keys expire on their own.
+                log.warning("Failed to release the lock for the game in channel %s", id, exc_info=True)
+
+    async def _keep_alive(self, lock: Lock, game: GameInstance) -> None:
+        from redis.exceptions import LockNotOwnedError, RedisError  # noqa: PLC0415
+
+        id = game.channel.id
+        while True:
+            await asyncio.sleep(self._lock_timeout / 3)
+            try:
+                await lock.reacquire()
+                async with self._client.pipeline(transaction=False) as pipe:
+                    pipe.pexpire(self._game_key(id), self._ttl)
+                    pipe.pexpire(self._players_key(id), self._ttl)
+                    pipe.exists(self._stop_key(id))
+                    *_, stop_requested = await pipe.execute()
+            except LockNotOwnedError:
+                # The lock expired and may now belong to another process, which must be the only one running the game.
+                log.warning("Lost the lock for the game in channel %s, stopping it", id)
+                game.stop()
+                return
+            except RedisError:
+                # Retry on the next tick; the lock only expires after several missed refreshes.
+                continue
+            if stop_requested:
+                game.stop()
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
 
 class View(ui.View):
     async def on_error(self, interaction: Interaction, error: Exception, item: ui.Item, /) -> None:
@@ -375,7 +636,10 @@ class ShootView(View):
 class Game(Cog):
     def __init__(self, bot: RussianRoulette) -> None:
         self.bot = bot
-        self.games = GameDB(self.bot)
+        self.games = GameDB.from_settings(self.bot, self.bot.settings.database)
+
+    async def cog_unload(self) -> None:
+        await self.games.close()
 
     async def cog_app_command_error(self, interaction: Interaction, error: app_commands.AppCommandError) -> None:
         message = str(error.original) if isinstance(error, app_commands.CommandInvokeError) else str(error)
@@ -385,11 +649,11 @@ class Game(Cog):
         else:
             await interaction.response.send_message(message, ephemeral=True)
 
-    def get_game_context(self, interaction: Interaction) -> GameInstance:
+    async def get_game_context(self, interaction: Interaction) -> GameInstance:
         if interaction.channel_id is None:
             msg = "channel id must not be None"
             raise ValueError(msg)
-        game = self.games.get(interaction.channel_id)
+        game = await self.games.get(interaction.channel_id)
         if game:
             return game
         msg = "No game has been started yet. Use </start:1045533617910206515> to start a new game."
@@ -401,16 +665,16 @@ class Game(Cog):
         if interaction.channel_id is None:
             msg = "channel id must not be None"
             raise ValueError(msg)
-        if self.games.get(interaction.channel_id):
-            msg = "A game is already in progress."
-            raise GameError(msg)
         view = StartGameView(interaction)
         game = view.game
-        self.games.put(game)
-        await view.send_embed()
-        await view.game.started.wait()
-        try:
+        # Only the process holding the channel's lock drives the game loop.
+        async with self.games.lock(game):
+            await self.games.put(game)
+            await view.send_embed()
+            await view.game.started.wait()
+            # Keep the stored game in sync so other processes see the current state.
             while not game.stopped.is_set():
+                await self.games.put(game)
                 view = ShootView(game)
                 await view.send_embed()
                 await view.finished.wait()
@@ -421,21 +685,18 @@ class Game(Cog):
                 url=settings.url,
             )
             await game.channel.send(embed=embed)
-        finally:
-            self.games.delete(game.channel.id)
 
     @app_commands.command()
     async def stop(self, interaction: Interaction) -> None:
         """Stop the current game."""
-        game = self.get_game_context(interaction)
-        game.stop()
-        self.games.delete(game.channel.id)
+        game = await self.get_game_context(interaction)
+        await self.games.stop(game.channel.id)
         await interaction.response.send_message("Stopped the current game.")
 
     @app_commands.command()
     async def info(self, interaction: Interaction) -> None:
         """Show information about the current game."""
-        game = self.get_game_context(interaction)
+        game = await self.get_game_context(interaction)
         description = f"Players: {' '.join(player.mention for player in game.players)}\n"
         if isinstance(game.channel, TextChannel | Thread | VoiceChannel | StageChannel):
             description += f"Channel: {game.channel.mention}"
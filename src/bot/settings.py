@@ -1,6 +1,7 @@
 import sys
 from collections.abc import Sequence
-from enum import IntEnum
+from enum import IntEnum, StrEnum
+from pathlib import Path
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -48,6 +49,25 @@ class GameSettings(BaseModel):
     )
 
 
+class DatabaseBackend(StrEnum):
+    JSON = "json"
+    REDIS = "redis"
+
+
+class DatabaseSettings(BaseModel):
+    backend: DatabaseBackend = DatabaseBackend.JSON
+    # Used by the JSON backend.
+    file_path: Path = Path("data/games.json")
+    # Used by the Redis backend.
+    url: str = "redis://localhost:6379/0"
+    max_connections: int = 10
+    # Seconds to wait for a free connection when all of them are in use.
+    pool_timeout: float = 5
+    key_prefix: str = "rr:"
+    # Seconds before a game lock held by a dead process expires.
+    lock_timeout: float = 60
+
+
 class Settings(BaseSettings):
     name: str = "Russian Roulette"
     url: str = "https://github.com/lemonyte/russian-roulette-bot"
@@ -61,10 +81,12 @@ class Settings(BaseSettings):
     discord_token: str
     activity: ActivitySettings = ActivitySettings()
     game: GameSettings = GameSettings()
+    database: DatabaseSettings = DatabaseSettings()
 
     model_config = SettingsConfigDict(
         yaml_file="settings_preview.yaml" if PREVIEW else "settings.yaml",
         env_file=".env",
         env_prefix="preview_" if PREVIEW else "",
+        env_nested_delimiter="__",
         extra="ignore",
     )
@@ -0,0 +1,4 @@
+import os
+
+# `bot.modules.game` loads the settings on import, which requires a token.
+os.environ.setdefault("DISCORD_TOKEN", "test")
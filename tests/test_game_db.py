@@ -0,0 +1,247 @@
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from bot.modules.game import GameError, GameInstance, JSONGameDB, RedisGameDB
+
+CHANNEL_ID = 100
+TTL = 30_000
+# Upper bound for waiting on the keep-alive task, which ticks every third of the lock timeout.
+WAIT_TIMEOUT = 5
+
+
+@dataclass(frozen=True)
+class FakeUser:
+    id: int
+
+
+@dataclass(frozen=True)
+class FakeChannel:
+    id: int
+
+
+USERS = {id: FakeUser(id) for id in (1, 2, 3)}
+CHANNEL = FakeChannel(CHANNEL_ID)
+
+
+@pytest.fixture
+def bot() -> SimpleNamespace:
+    return SimpleNamespace(
+        get_channel=lambda id: CHANNEL if id == CHANNEL_ID else None,
+        get_user=USERS.get,
+    )
+
+
+@pytest.fixture
+def server() -> fakeredis.FakeServer:
+    return fakeredis.FakeServer()
+
+
+def redis_db(bot: SimpleNamespace, server: fakeredis.FakeServer, **kwargs: float) -> RedisGameDB:
+    client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    return RedisGameDB(bot, client=client, **kwargs)  # type: ignore[ty:invalid-argument-type]
+
+
+@pytest.fixture
+def redis_url() -> Iterator[str]:
+    tcp_server = fakeredis.TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    thread = threading.Thread(target=tcp_server.serve_forever, daemon=True)
+    thread.start()
+    host, port = tcp_server.server_address[:2]
+    yield f"redis://{host}:{port}/0"
+    tcp_server.shutdown()
+    tcp_server.server_close()
+
+
+@pytest.fixture
+def json_db(bot: SimpleNamespace, tmp_path: Path) -> JSONGameDB:
+    file_path = tmp_path / "games.json"
+    file_path.write_text("{}")
+    return JSONGameDB(bot, file_path=file_path)  # type: ignore[ty:invalid-argument-type]
+
+
+def new_game() -> GameInstance:
+    return GameInstance(CHANNEL, USERS[1], [USERS[1], USERS[2], USERS[3]])  # type: ignore[ty:invalid-argument-type]
+
+
+async def test_redis_round_trip(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    db = redis_db(bot, server)
+    game = new_game()
+    game.start()
+    game.next()
+    assert await db.get(CHANNEL_ID) is None
+    assert await db.put(game) == str(CHANNEL_ID)
+    stored = await db.get(CHANNEL_ID)
+    assert stored is not None
+    assert stored.to_dict() == game.to_dict()
+    hash_ = await db._client.hgetall(db._game_key(CHANNEL_ID))  # type: ignore[ty:invalid-await]
+    assert hash_["started"] == "1"
+    assert hash_["stopped"] == "0"
+
+
+async def test_redis_put_empty_players(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    db = redis_db(bot, server)
+    game = new_game()
+    await db.put(game)
+    for player in list(game.players):
+        game.remove_player(player)
+    await db.put(game)
+    stored = await db.get(CHANNEL_ID)
+    assert stored is not None
+    assert stored.players == []
+    assert not stored.started.is_set()
+    assert not stored.stopped.is_set()
+
+
+async def test_redis_delete(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    db = redis_db(bot, server)
+    await db.put(new_game())
+    await db.delete(CHANNEL_ID)
+    assert await db.get(CHANNEL_ID) is None
+
+
+async def test_redis_keys_expire(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    db = redis_db(bot, server, lock_timeout=TTL / 1000)
+    await db.put(new_game())
+    assert 0 < await db._client.pttl(db._game_key(CHANNEL_ID)) <= TTL
+    assert 0 < await db._client.pttl(db._players_key(CHANNEL_ID)) <= TTL
+
+
+async def test_redis_lock_is_exclusive(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    first = redis_db(bot, server)
+    second = redis_db(bot, server)
+    async with first.lock(new_game()):
+        await first.put(new_game())
+        with pytest.raises(GameError):
+            async with second.lock(new_game()):
+                pass
+    # Releasing the lock deletes the game, so the channel is free again.
+    assert await second.get(CHANNEL_ID) is None
+    async with second.lock(new_game()):
+        pass
+
+
+async def test_redis_pool_waits_for_connections(bot: SimpleNamespace, redis_url: str) -> None:
+    db = RedisGameDB(bot, url=redis_url, max_connections=2)  # type: ignore[ty:invalid-argument-type]
+    try:
+        games = [new_game() for _ in range(10)]
+        await asyncio.gather(*(db.put(game) for game in games))
+        stored = await asyncio.gather(*(db.get(CHANNEL_ID) for _ in range(10)))
+        assert all(game is not None for game in stored)
+    finally:
+        await db.close()
+
+
+async def wait_for_refresh(db: RedisGameDB) -> None:
+    ttl = await db._client.pttl(db._lock_key(CHANNEL_ID))
+    while True:
+        await asyncio.sleep(0.01)
+        previous, ttl = ttl, await db._client.pttl(db._lock_key(CHANNEL_ID))
+        if ttl > previous:
+            return
+
+
+async def test_redis_lock_is_kept_alive(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    first = redis_db(bot, server, lock_timeout=1)
+    second = redis_db(bot, server, lock_timeout=1)
+    game = new_game()
+    async with first.lock(game):
+        await asyncio.wait_for(wait_for_refresh(first), WAIT_TIMEOUT)
+        with pytest.raises(GameError):
+            async with second.lock(new_game()):
+                pass
+    assert not game.stopped.is_set()
+
+
+async def test_redis_lost_lock_stops_game(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    db = redis_db(bot, server, lock_timeout=1)
+    game = new_game()
+    async with db.lock(game):
+        await db.put(game)
+        await db._client.delete(db._lock_key(CHANNEL_ID))
+        await asyncio.wait_for(game.stopped.wait(), WAIT_TIMEOUT)
+        # Another process may own the channel now, so its state is left alone.
+        await db._client.set(db._lock_key(CHANNEL_ID), "other")
+    assert await db.get(CHANNEL_ID) is not None
+
+
+async def test_redis_stop_from_other_process(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    owner = redis_db(bot, server, lock_timeout=1)
+    other = redis_db(bot, server, lock_timeout=1)
+    game = new_game()
+    async with owner.lock(game):
+        await owner.put(game)
+        await other.stop(CHANNEL_ID)
+        # The state stays until the owner stops its game and releases the lock.
+        assert await other.get(CHANNEL_ID) is not None
+        await asyncio.wait_for(game.stopped.wait(), WAIT_TIMEOUT)
+    assert await other.get(CHANNEL_ID) is None
+
+
+async def test_redis_release_failure_keeps_original_error(
+    bot: SimpleNamespace,
+    server: fakeredis.FakeServer,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    db = redis_db(bot, server)
+
+    async def fail(*_args: object, **_kwargs: object) -> None:
+        raise RedisConnectionError
+
+    db._release_game = fail  # type: ignore[ty:invalid-assignment]
+
+    async def run_failing_game() -> None:
+        async with db.lock(new_game()):
+            msg = "game failed"
+            raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="game failed"):
+        await run_failing_game()
+    assert "Failed to release the lock" in caplog.text
+    assert CHANNEL_ID not in db._running
+    # The lock is left to expire on its own.
+    with pytest.raises(GameError):
+        async with db.lock(new_game()):
+            pass
+
+
+async def test_redis_stop_stale_game(bot: SimpleNamespace, server: fakeredis.FakeServer) -> None:
+    db = redis_db(bot, server)
+    await db.put(new_game())
+    await db.stop(CHANNEL_ID)
+    assert await db.get(CHANNEL_ID) is None
+
+
+async def test_json_round_trip(json_db: JSONGameDB) -> None:
+    game = new_game()
+    game.start()
+    assert await json_db.get(CHANNEL_ID) is None
+    assert await json_db.put(game) == str(CHANNEL_ID)
+    stored = await json_db.get(CHANNEL_ID)
+    assert stored is not None
+    assert stored.to_dict() == game.to_dict()
+    assert json.loads(json_db._file_path.read_text())[str(CHANNEL_ID)]["started"] is True
+    await json_db.delete(CHANNEL_ID)
+    assert await json_db.get(CHANNEL_ID) is None
+
+
+async def test_json_lock(json_db: JSONGameDB) -> None:
+    game = new_game()
+    async with json_db.lock(game):
+        await json_db.put(game)
+        with pytest.raises(GameError):
+            async with json_db.lock(new_game()):
+                pass
+        await json_db.stop(CHANNEL_ID)
+        assert game.stopped.is_set()
+    assert await json_db.get(CHANNEL_ID) is None
+    async with json_db.lock(new_game()):
+        pass